@@ -35,6 +35,10 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "async": ["aiohttp", "orjson"],
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "yt-liveread=yt_liveread.main:main",
@@ -2,12 +2,64 @@
 
 import queue
 import re
+import signal
 import threading
-from typing import Optional
-
-from chat_downloader import ChatDownloader
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 from .config import Config
+from .message_queue import MessageRing
+
+if TYPE_CHECKING:
+    import multiprocessing.process
+    import multiprocessing.queues
+    import multiprocessing.synchronize
+
+# Compiled once at import; used on every chat message
+_URL_RE = re.compile(r"http\S+")
+
+# Shared fallback for messages without an author; only ever read via .get()
+_EMPTY: dict = {}
+
+# Set once chat-downloader's YouTube module has been switched to orjson
+_orjson_installed = False
+
+
+def _install_orjson_parser():
+    """Parse chat-downloader's YouTube JSON with orjson when it is installed
+
+    Only chat-downloader's YouTube site class and module are patched; the
+    stdlib json module and other users of requests are left alone. orjson's
+    JSONDecodeError subclasses json.JSONDecodeError, so chat-downloader's
+    own error handling still applies.
+    """
+    global _orjson_installed
+    if _orjson_installed:
+        return
+
+    try:
+        import orjson
+        from chat_downloader.sites import youtube
+    except ImportError:
+        return
+
+    session_post = youtube.YouTubeChatDownloader._session_post
+
+    def _session_post(self, url, **kwargs):
+        # Continuation polls: one POST and response.json() per chat batch
+        response = session_post(self, url, **kwargs)
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    def try_parse_json(text, default=None):
+        # Initial page data (ytInitialData, ytcfg)
+        try:
+            return orjson.loads(text)
+        except (orjson.JSONDecodeError, TypeError):
+            return default
+
+    youtube.YouTubeChatDownloader._session_post = _session_post
+    youtube.try_parse_json = try_parse_json
+    _orjson_installed = True
 
 
 class ChatReader:
@@ -16,13 +68,16 @@ class ChatReader:
     def __init__(
         self,
         config: Config,
-        message_queue: queue.Queue,
-        shutdown_event: threading.Event,
+        message_queue: Union[MessageRing, "multiprocessing.queues.Queue"],
+        shutdown_event: Union[threading.Event, "multiprocessing.synchronize.Event"],
     ):
         self.config = config
         self.message_queue = message_queue
         self.shutdown_event = shutdown_event
-        self.thread: Optional[threading.Thread] = None
+        self._max_len = config.max_message_length
+        self._include_username = config.include_username
+        # A multiprocessing.Process instead of a thread when ipc_mode is "process"
+        self.thread: Optional[Union[threading.Thread, "multiprocessing.process.BaseProcess"]] = None
 
     def _format_message(self, message: dict) -> Optional[str]:
         """Format a chat message for TTS
@@ -37,44 +92,73 @@ class ChatReader:
         if message.get("message_type") != "text_message":
             return None
 
-        author = message.get("author", {}).get("name", "Unknown")
-        text = message.get("message", "")
-
+        text = message.get("message")
         if not text:
             return None
 
         # Truncate long messages
-        if len(text) > self.config.max_message_length:
-            text = text[: self.config.max_message_length] + "..."
+        max_len = self._max_len
+        if len(text) > max_len:
+            text = text[:max_len] + "..."
 
         # Remove URLs (replace with placeholder)
-        text = re.sub(r"http\S+", "[link]", text)
+        if "http" in text:
+            text = _URL_RE.sub("[link]", text)
 
         # Format with or without username
-        if self.config.include_username:
+        if self._include_username:
+            author = (message.get("author") or _EMPTY).get("name", "Unknown")
             return f"{author} says: {text}"
-        else:
-            return text
+        return text
+
+    def _connect(self) -> Optional[Iterator[dict]]:
+        """Connect to the live chat using the configured backend
+
+        Returns:
+            Blocking iterator over chat message dictionaries, or None if
+            chat-downloader is not installed (shutdown_event is set)
+
+        Raises:
+            ValueError: If the chat could not be parsed or is unavailable
+        """
+        if self.config.chat_backend == "async":
+            from .chat_reader_async import iter_chat
+
+            return iter_chat(self.config.youtube_url, self.config.cookies_path)
+
+        try:
+            from chat_downloader import ChatDownloader
+        except ImportError:
+            print("ERROR: chat-downloader is not installed")
+            print("Install with: pip install -r requirements.txt")
+            self.shutdown_event.set()
+            return None
+
+        _install_orjson_parser()
+
+        # Create ChatDownloader with cookies if provided
+        downloader_params = {}
+        if self.config.cookies_path:
+            downloader_params['cookies'] = self.config.cookies_path
+
+        downloader = ChatDownloader(**downloader_params)
+        return downloader.get_chat(
+            self.config.youtube_url,
+            message_groups=['messages', 'superchat'],
+        )
 
     def _run(self):
         """Main chat reader loop"""
         try:
             print(f"Connecting to YouTube chat: {self.config.youtube_url}")
-
-            # Create ChatDownloader with cookies if provided
-            downloader_params = {}
             if self.config.cookies_path:
                 print(f"Using cookies from: {self.config.cookies_path}")
-                downloader_params['cookies'] = self.config.cookies_path
-
-            downloader = ChatDownloader(**downloader_params)
 
             # Try to get chat with additional error information
             try:
-                chat = downloader.get_chat(
-                    self.config.youtube_url,
-                    message_groups=['messages', 'superchat'],
-                )
+                chat = self._connect()
+                if chat is None:
+                    return
                 print("Connected to YouTube chat successfully")
             except ValueError as e:
                 error_msg = str(e).lower()
@@ -110,19 +194,32 @@ class ChatReader:
                 self.shutdown_event.set()
                 return
 
+            put = self.message_queue.put_nowait
+            qsize = self.message_queue.qsize
+            max_size = self.config.queue_max_size
+            is_shutdown = self.shutdown_event.is_set
+            fmt = self._format_message
+
             # Read messages from chat
             message_count = 0
             for message in chat:
                 # Check for shutdown
-                if self.shutdown_event.is_set():
+                if is_shutdown():
                     break
 
+                # Queue is full, so this message would be dropped anyway;
+                # skip formatting it. Only this thread adds to the queue, so
+                # it can't fill up between here and put(). (qsize is
+                # approximate for multiprocessing.Queue; put still guards.)
+                if qsize() >= max_size:
+                    continue
+
                 # Format and queue message
-                formatted = self._format_message(message)
+                formatted = fmt(message)
                 if formatted:
                     try:
                         # Try to put in queue, skip if full
-                        self.message_queue.put(formatted, timeout=0.1)
+                        put(formatted)
                         message_count += 1
 
                         # Print first message as confirmation
@@ -146,15 +243,42 @@ class ChatReader:
         finally:
             print("Chat reader thread stopped")
 
+    @staticmethod
+    def _entrypoint(config: Config, message_queue, shutdown_event):
+        """Chat reader process entry point (ipc_mode "process")
+
+        Args:
+            config: Application configuration
+            message_queue: multiprocessing.Queue shared with the TTS speaker
+            shutdown_event: multiprocessing.Event shared with the main process
+        """
+        # Ctrl+C is handled by the main process, which sets shutdown_event
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        # Don't block process exit on messages the speaker will never read
+        message_queue.cancel_join_thread()
+
+        ChatReader(config, message_queue, shutdown_event)._run()
+
     def start(self):
-        """Start the chat reader thread"""
+        """Start the chat reader thread (or process)"""
         if self.thread is not None and self.thread.is_alive():
             raise RuntimeError("Chat reader thread is already running")
 
-        self.thread = threading.Thread(target=self._run, daemon=True)
+        if self.config.ipc_mode == "process":
+            import multiprocessing
+
+            # Same spawn context main() used for the queue and event
+            self.thread = multiprocessing.get_context("spawn").Process(
+                target=ChatReader._entrypoint,
+                args=(self.config, self.message_queue, self.shutdown_event),
+                daemon=True,
+            )
+        else:
+            self.thread = threading.Thread(target=self._run, daemon=True)
         self.thread.start()
 
     def join(self, timeout: Optional[float] = None):
-        """Wait for the chat reader thread to finish"""
+        """Wait for the chat reader thread (or process) to finish"""
         if self.thread is not None:
             self.thread.join(timeout=timeout)
@@ -0,0 +1,242 @@
+"""Async YouTube live chat client using the innertube API
+
+Alternative to chat-downloader (--chat-backend async). Polls YouTube's
+``youtubei/v1/live_chat/get_live_chat`` endpoint directly with aiohttp and
+yields messages in the same dict shape chat-downloader produces, so
+ChatReader formats and queues them unchanged.
+"""
+
+import asyncio
+import http.cookiejar
+import re
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+_YT_HOME = "https://www.youtube.com"
+_LIVE_CHAT_URL = _YT_HOME + "/live_chat"
+_GET_LIVE_CHAT_URL = _YT_HOME + "/youtubei/v1/live_chat/get_live_chat"
+
+_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+_VIDEO_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/live/)([\w-]+)")
+_YT_INITIAL_DATA_RE = re.compile(
+    r"(?:window\s*\[\s*[\"']ytInitialData[\"']\s*\]|ytInitialData)\s*=\s*({.+?})\s*;"
+    r"\s*(?:var\s+(?:meta|head)|</script|\n)"
+)
+_YT_CFG_RE = re.compile(r"ytcfg\.set\s*\(\s*({.+?})\s*\)\s*;")
+
+# Poll at least this often even if YouTube suggests a longer timeout (ms)
+_MAX_POLL_MS = 5000
+
+# Consecutive failed polls tolerated before giving up
+_MAX_RETRIES = 5
+
+# Per-request timeout in seconds; a stalled poll is retried rather than
+# blocking the reader for aiohttp's default 5 minutes
+_REQUEST_TIMEOUT = 20
+
+
+def _runs_text(runs: List[dict]) -> str:
+    """Join innertube message runs, using emoji shortcuts for emoji runs"""
+    parts = []
+    for run in runs:
+        text = run.get("text")
+        if text is None:
+            emoji = run.get("emoji") or {}
+            shortcuts = emoji.get("shortcuts")
+            text = shortcuts[0] if shortcuts else emoji.get("emojiId", "")
+        parts.append(text)
+    return "".join(parts)
+
+
+def _next_continuation(live_chat: dict) -> Optional[Tuple[str, float]]:
+    """Return (continuation token, poll delay in seconds), or None if chat ended"""
+    for continuation in live_chat.get("continuations") or ():
+        for data in continuation.values():
+            token = data.get("continuation")
+            if token:
+                timeout_ms = min(data.get("timeoutMs", _MAX_POLL_MS), _MAX_POLL_MS)
+                return token, timeout_ms / 1000
+    return None
+
+
+def _live_chat_token(live_chat: dict) -> Optional[str]:
+    """Return the "Live chat" (all messages) continuation token, if present
+
+    The page's default continuation is "Top chat", which YouTube filters;
+    the second entry of the header's view selector switches to the full feed.
+    """
+    try:
+        items = live_chat["header"]["liveChatHeaderRenderer"]["viewSelector"][
+            "sortFilterSubMenuRenderer"
+        ]["subMenuItems"]
+        return items[1]["continuation"]["reloadContinuationData"]["continuation"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _load_cookies(cookies_path: str) -> Dict[str, str]:
+    """Load YouTube cookies from a Netscape-format cookies file"""
+    jar = http.cookiejar.MozillaCookieJar(cookies_path)
+    jar.load(ignore_discard=True, ignore_expires=True)
+    return {cookie.name: cookie.value for cookie in jar if "youtube.com" in cookie.domain}
+
+
+class InnertubeChat:
+    """Polls a YouTube live chat via the innertube get_live_chat endpoint"""
+
+    def __init__(self, youtube_url: str, cookies_path: Optional[str] = None):
+        self.youtube_url = youtube_url
+        self.cookies_path = cookies_path
+        self._session = None
+        self._api_url = ""
+        self._context: dict = {}
+        self._continuation: Optional[str] = None
+
+    async def connect(self):
+        """Open the HTTP session and fetch the initial continuation token
+
+        Raises:
+            ValueError: If the live chat page could not be parsed (stream not
+                live, chat disabled, or a cookie consent page was returned)
+        """
+        match = _VIDEO_ID_RE.search(self.youtube_url)
+        if not match:
+            raise ValueError(f"Unable to parse video ID from URL: {self.youtube_url}")
+
+        cookies = _load_cookies(self.cookies_path) if self.cookies_path else None
+        self._session = aiohttp.ClientSession(
+            headers={"User-Agent": _USER_AGENT, "Accept-Language": "en-US,en"},
+            cookies=cookies,
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT),
+        )
+
+        async with self._session.get(
+            _LIVE_CHAT_URL, params={"is_popout": "1", "v": match.group(1)}
+        ) as response:
+            response.raise_for_status()
+            html = await response.text()
+
+        data_match = _YT_INITIAL_DATA_RE.search(html)
+        cfg_match = _YT_CFG_RE.search(html)
+        if not data_match or not cfg_match:
+            raise ValueError("Unable to parse initial live chat data")
+
+        ytcfg = _loads(cfg_match.group(1))
+        live_chat = (
+            _loads(data_match.group(1)).get("contents", {}).get("liveChatRenderer")
+        )
+        token = None
+        if live_chat:
+            # Fall back to the page's default (Top chat) token
+            token = _live_chat_token(live_chat)
+            if token is None:
+                continuation = _next_continuation(live_chat)
+                token = continuation[0] if continuation else None
+        api_key = ytcfg.get("INNERTUBE_API_KEY")
+        if not token or not api_key:
+            raise ValueError("Unable to parse initial live chat data")
+
+        self._continuation = token
+        self._api_url = f"{_GET_LIVE_CHAT_URL}?key={api_key}&prettyPrint=false"
+        self._context = ytcfg.get("INNERTUBE_CONTEXT") or {}
+
+    async def messages(self) -> AsyncIterator[dict]:
+        """Yield chat messages until the chat ends
+
+        Only regular text messages are yielded, shaped like chat-downloader's
+        output: ``{"message_type", "message", "author": {"name"}}``.
+        """
+        failures = 0
+        while self._continuation:
+            payload = {"context": self._context, "continuation": self._continuation}
+            try:
+                async with self._session.post(self._api_url, json=payload) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                failures += 1
+                if failures > _MAX_RETRIES:
+                    raise
+                await asyncio.sleep(failures)
+                continue
+            failures = 0
+
+            live_chat = (_loads(body).get("continuationContents") or {}).get(
+                "liveChatContinuation"
+            )
+            if not live_chat:
+                # Stream ended or chat was closed
+                return
+
+            for action in live_chat.get("actions") or ():
+                item = (action.get("addChatItemAction") or {}).get("item") or {}
+                renderer = item.get("liveChatTextMessageRenderer")
+                if renderer is None:
+                    continue
+                yield {
+                    "message_type": "text_message",
+                    "message": _runs_text((renderer.get("message") or {}).get("runs") or ()),
+                    "author": {
+                        "name": (renderer.get("authorName") or {}).get("simpleText", "Unknown")
+                    },
+                }
+
+            continuation = _next_continuation(live_chat)
+            if continuation is None:
+                return
+            self._continuation, delay = continuation
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        """Close the HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def iter_chat(youtube_url: str, cookies_path: Optional[str] = None) -> Iterator[dict]:
+    """Connect to a live chat and return a blocking iterator over its messages
+
+    Runs the async client on a private event loop in the calling thread, so
+    ChatReader can consume it exactly like chat-downloader's iterator.
+    Connection errors (including ValueError for unparsable pages) are raised
+    here rather than on first iteration.
+    """
+    loop = asyncio.new_event_loop()
+    chat = InnertubeChat(youtube_url, cookies_path)
+    try:
+        loop.run_until_complete(chat.connect())
+    except BaseException:
+        loop.run_until_complete(chat.close())
+        loop.close()
+        raise
+    return _drain(loop, chat)
+
+
+def _drain(loop: asyncio.AbstractEventLoop, chat: InnertubeChat) -> Iterator[dict]:
+    """Step the async message generator from synchronous code"""
+    messages = chat.messages()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(messages.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(messages.aclose())
+        loop.run_until_complete(chat.close())
+        loop.close()
@@ -1,5 +1,6 @@
 """Configuration for YouTube Live Chat TTS Reader"""
 
+import importlib.util
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -13,6 +14,7 @@ class Config:
     youtube_url: str
     max_message_length: int = 200
     cookies_path: Optional[str] = None
+    chat_backend: str = "chat-downloader"  # or "async" (aiohttp innertube client)
 
     # Speech Dispatcher settings
     voice_module: str = "espeak-ng"
@@ -27,6 +29,9 @@ class Config:
     # Queue settings
     queue_max_size: int = 50
 
+    # Run the chat reader in a "thread" or a separate "process"
+    ipc_mode: str = "thread"
+
     def validate(self) -> None:
         """Validate configuration values"""
         if not self.youtube_url:
@@ -47,6 +52,17 @@ class Config:
         if self.queue_max_size < 1:
             raise ValueError("Queue max size must be positive")
 
+        if self.ipc_mode not in ("thread", "process"):
+            raise ValueError("IPC mode must be 'thread' or 'process'")
+
+        if self.chat_backend not in ("chat-downloader", "async"):
+            raise ValueError("Chat backend must be 'chat-downloader' or 'async'")
+
+        if self.chat_backend == "async" and importlib.util.find_spec("aiohttp") is None:
+            raise ValueError(
+                "The async chat backend requires aiohttp (pip install aiohttp)"
+            )
+
         if self.cookies_path is not None:
             if not os.path.isfile(self.cookies_path):
                 raise ValueError(f"Cookie file does not exist: {self.cookies_path}")
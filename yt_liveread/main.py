@@ -2,17 +2,26 @@
 """YouTube Live Chat TTS Reader - Main Entry Point"""
 
 import argparse
-import functools
-import queue
 import re
-import select
-import signal
 import sys
-import threading
 
-from .chat_reader import ChatReader
-from .config import Config
-from .tts_speaker import TTSSpeaker
+# Remaining imports happen in main(), after argument parsing
+
+# Accepted YouTube URL formats (watch?v=, /live/ and youtu.be short links)
+_YT_URL_RE = re.compile(
+    r"^https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|live/)|youtu\.be/)[\w-]+"
+)
+
+# Terminal escape sequences (arrow/function keys: CSI and SS3 forms, and
+# Alt+key), stripped from keyboard input before it is read as commands
+_ESCAPE_SEQ_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|O.|.)?", re.DOTALL)
+
+_VOICE_CHOICES = ("espeak-ng", "pico", "festival")
+_CHAT_BACKEND_CHOICES = ("chat-downloader", "async")
+_IPC_CHOICES = ("thread", "process")
+
+# argparse.ArgumentParser built by _get_parser() on first use
+_PARSER = None
 
 
 def validate_youtube_url(url: str) -> str:
@@ -27,16 +36,8 @@ def validate_youtube_url(url: str) -> str:
     Raises:
         argparse.ArgumentTypeError: If URL is invalid
     """
-    # Accept various YouTube URL formats
-    patterns = [
-        r"^https?://(www\.)?youtube\.com/watch\?v=[\w-]+",
-        r"^https?://youtu\.be/[\w-]+",
-        r"^https?://(www\.)?youtube\.com/live/[\w-]+",
-    ]
-
-    for pattern in patterns:
-        if re.match(pattern, url):
-            return url
+    if _YT_URL_RE.match(url):
+        return url
 
     raise argparse.ArgumentTypeError(
         f"Invalid YouTube URL: {url}\n"
@@ -44,8 +45,12 @@ def validate_youtube_url(url: str) -> str:
     )
 
 
-def parse_args():
-    """Parse command-line arguments"""
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser on first use and reuse it afterwards"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
     parser = argparse.ArgumentParser(
         description="Read YouTube live chat messages aloud using text-to-speech",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -67,7 +72,7 @@ Controls (while running):
 
     parser.add_argument(
         "--voice",
-        choices=["espeak-ng", "pico", "festival"],
+        choices=_VOICE_CHOICES,
         default="espeak-ng",
         help="TTS voice engine (default: espeak-ng)",
     )
@@ -126,7 +131,28 @@ Controls (while running):
         help="Path to cookies file (Netscape format) to bypass YouTube consent page",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--chat-backend",
+        choices=_CHAT_BACKEND_CHOICES,
+        default="chat-downloader",
+        help="Chat client: chat-downloader, or async (aiohttp, polls YouTube's "
+        "live chat API directly) (default: chat-downloader)",
+    )
+
+    parser.add_argument(
+        "--ipc",
+        choices=_IPC_CHOICES,
+        default="thread",
+        help="Run the chat reader in a thread or a separate process (default: thread)",
+    )
+
+    _PARSER = parser
+    return parser
+
+
+def parse_args():
+    """Parse command-line arguments"""
+    return _get_parser().parse_args()
 
 
 def signal_handler(sig, frame, shutdown_event):
@@ -140,6 +166,19 @@ def main():
     # Parse arguments
     args = parse_args()
 
+    import functools
+    import os
+    import select
+    import signal
+    import termios
+    import threading
+    import tty
+
+    from .chat_reader import ChatReader
+    from .config import Config
+    from .message_queue import MessageRing
+    from .tts_speaker import TTSSpeaker
+
     # Create configuration
     config = Config(
         youtube_url=args.url,
@@ -152,6 +191,8 @@ def main():
         language=args.language,
         queue_max_size=args.queue_size,
         cookies_path=args.cookies,
+        chat_backend=args.chat_backend,
+        ipc_mode=args.ipc,
     )
 
     # Validate configuration
@@ -162,16 +203,33 @@ def main():
         sys.exit(1)
 
     # Create shared state
-    message_queue = queue.Queue(maxsize=config.queue_max_size)
+    if config.ipc_mode == "process":
+        # Chat reader runs in its own process so chat parsing doesn't
+        # contend with the TTS speaker for the GIL
+        import multiprocessing
+
+        # spawn, not fork: the TTS thread (and speechd's socket thread) are
+        # already running when the reader process starts
+        mp_context = multiprocessing.get_context("spawn")
+        message_queue = mp_context.Queue(maxsize=config.queue_max_size)
+        shutdown_event = mp_context.Event()
+    else:
+        message_queue = MessageRing(maxsize=config.queue_max_size)
+        shutdown_event = threading.Event()
     pause_event = threading.Event()
     pause_event.set()  # Start unpaused
-    shutdown_event = threading.Event()
 
     # Setup signal handler for Ctrl+C
     signal.signal(
         signal.SIGINT, functools.partial(signal_handler, shutdown_event=shutdown_event)
     )
 
+    # Self-pipe: Python's C-level signal handler writes a byte here, so the
+    # control loop's select() wakes the moment Ctrl+C is pressed
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+
     # Create components
     chat_reader = ChatReader(config, message_queue, shutdown_event)
     tts_speaker = TTSSpeaker(config, message_queue, pause_event, shutdown_event)
@@ -183,6 +241,9 @@ def main():
     print(f"Voice: {config.voice_module}")
     print("=" * 50)
 
+    stdin_fd = sys.stdin.fileno()
+    saved_tty = None
+
     try:
         tts_speaker.start()
 
@@ -201,53 +262,72 @@ def main():
         print("-" * 50)
         print()
 
+        # Put the terminal in cbreak mode so single keypresses arrive
+        # without Enter (and without echo); restored in the finally block
+        if sys.stdin.isatty():
+            saved_tty = termios.tcgetattr(stdin_fd)
+            tty.setcbreak(stdin_fd)
+
         # Main control loop with non-blocking input
         # Use select to check if input is available, allowing us to
         # periodically check shutdown_event (fixes blocking on input)
         # Note: select() on stdin only works on Unix-like systems (Linux, macOS)
         while not shutdown_event.is_set():
-            try:
-                # Wait for input with timeout (0.5s) to check shutdown_event
-                readable, _, _ = select.select([sys.stdin], [], [], 0.5)
-
-                if readable:
-                    cmd = sys.stdin.readline()
-                    if not cmd:
-                        # EOF (stdin closed)
-                        break
-
-                    cmd = cmd.strip().lower()
-
-                    if cmd == "p":
-                        if pause_event.is_set():
-                            pause_event.clear()
-                            print("⏸  PAUSED")
-                        else:
-                            pause_event.set()
-                            print("▶  RESUMED")
-
-                    elif cmd == "q":
-                        print("Quitting...")
-                        shutdown_event.set()
-                        break
-
-                    elif cmd == "":
-                        # Allow empty input (just pressing Enter)
-                        continue
+            # Wait for input with timeout (0.25s) to check shutdown_event
+            readable, _, _ = select.select([stdin_fd, wakeup_r], [], [], 0.25)
+            if not readable:
+                continue
+
+            if wakeup_r in readable:
+                # A signal arrived; its handler has already run by now, so
+                # recheck shutdown_event right away
+                os.read(wakeup_r, 512)
+                continue
+
+            # Read straight from the fd so nothing sits in sys.stdin's buffer
+            # where select() can't see it
+            keys = os.read(stdin_fd, 1024).decode(errors="ignore")
+            if not keys:
+                # EOF (stdin closed)
+                break
 
+            for key in _ESCAPE_SEQ_RE.sub("", keys).lower():
+                if key == "p":
+                    if pause_event.is_set():
+                        pause_event.clear()
+                        print("⏸  PAUSED")
                     else:
-                        print(f"Unknown command: {cmd}")
-                        print("Use 'p' to pause/resume or 'q' to quit")
+                        pause_event.set()
+                        print("▶  RESUMED")
 
-            except EOFError:
-                # stdin closed
-                break
+                elif key == "q" or key == "\x04":
+                    # 'q' or Ctrl+D (cbreak mode delivers it as a byte)
+                    print("Quitting...")
+                    shutdown_event.set()
+                    break
+
+                elif key.isspace() or not key.isprintable():
+                    # Ignore Enter, stray whitespace (e.g. piped input) and
+                    # other control characters
+                    continue
+
+                else:
+                    print(f"Unknown command: {key}")
+                    print("Use 'p' to pause/resume or 'q' to quit")
 
     except Exception as e:
         print(f"Error: {e}")
         shutdown_event.set()
 
     finally:
+        # Restore the terminal before printing shutdown messages
+        if saved_tty is not None:
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, saved_tty)
+
+        signal.set_wakeup_fd(-1)
+        os.close(wakeup_r)
+        os.close(wakeup_w)
+
         # Wait for threads to finish
         print("Waiting for threads to stop...")
 
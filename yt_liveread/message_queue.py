@@ -0,0 +1,79 @@
+"""Message handoff between the chat reader and TTS speaker threads"""
+
+import queue
+import threading
+from typing import List, Optional
+
+
+class MessageRing:
+    """Fixed-size single-producer/single-consumer ring buffer
+
+    Designed for one producer (ChatReader) and one consumer (TTSSpeaker).
+    The producer owns ``_tail`` and the consumer owns ``_head``; each index is
+    only ever written by one thread and CPython stores to list slots and
+    attributes are atomic, so no lock is needed. The event only exists to
+    wake the consumer when the ring goes from empty to non-empty.
+
+    Mirrors the non-blocking subset of ``queue.Queue`` (``queue.Full`` and
+    ``queue.Empty`` are raised as usual).
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buf: List[Optional[str]] = [None] * maxsize
+        self._head = 0  # Next slot to read (consumer only)
+        self._tail = 0  # Next slot to write (producer only)
+        self._not_empty = threading.Event()
+
+    def qsize(self) -> int:
+        """Return the number of queued messages"""
+        return self._tail - self._head
+
+    def put_nowait(self, item: str) -> None:
+        """Add a message and wake the consumer
+
+        Raises:
+            queue.Full: If the ring has no free slot
+        """
+        tail = self._tail
+        if tail - self._head >= self.maxsize:
+            raise queue.Full
+
+        self._buf[tail % self.maxsize] = item
+        self._tail = tail + 1
+        self._not_empty.set()
+
+    def get(self, timeout: Optional[float] = None) -> str:
+        """Remove and return the oldest message
+
+        Args:
+            timeout: Seconds to wait for a message if none is queued
+
+        Raises:
+            queue.Empty: If no message arrived before the timeout
+        """
+        if self._head == self._tail:
+            # Clear before re-checking so a put landing in between is not lost
+            self._not_empty.clear()
+            if self._head == self._tail and not self._not_empty.wait(timeout):
+                raise queue.Empty
+        return self._take()
+
+    def get_nowait(self) -> str:
+        """Remove and return the oldest message without waiting
+
+        Raises:
+            queue.Empty: If no message is queued
+        """
+        if self._head == self._tail:
+            raise queue.Empty
+        return self._take()
+
+    def _take(self) -> str:
+        """Pop the slot at head; caller must have checked the ring is non-empty"""
+        head = self._head
+        index = head % self.maxsize
+        item = self._buf[index]
+        self._buf[index] = None  # Drop the reference so the slot can be freed
+        self._head = head + 1
+        return item
@@ -1,18 +1,31 @@
 """Text-to-speech speaker thread using Speech Dispatcher"""
 
+import functools
 import queue
-import sys
 import threading
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Optional, Union
+
+from .config import Config
+from .message_queue import MessageRing
+
+if TYPE_CHECKING:
+    import multiprocessing.queues
+    import multiprocessing.synchronize
 
-try:
     import speechd
-except ImportError:
-    print("ERROR: python3-speechd is not installed")
-    print("Install with: sudo apt install python3-speechd speech-dispatcher")
-    sys.exit(1)
 
-from .config import Config
+# Utterances handed to Speech Dispatcher at once: one playing, one queued
+# behind it so the next message is ready as soon as the current one ends
+_MAX_IN_FLIGHT = 2
+
+# Used to size how long to wait for a slot before assuming an END/CANCEL
+# callback was lost (python-speechd drops callbacks that arrive before they
+# are registered). Deliberately pessimistic: a slow but real utterance must
+# never trigger a reset.
+_CHARS_PER_SECOND = 12  # Roughly espeak-ng at rate 0, rounded down
+_USERNAME_ALLOWANCE = 60  # Characters for "{username} says: " and "..."
+_SLOT_TIMEOUT_MARGIN = 10.0
 
 
 class TTSSpeaker:
@@ -21,20 +34,32 @@ class TTSSpeaker:
     def __init__(
         self,
         config: Config,
-        message_queue: queue.Queue,
+        message_queue: Union[MessageRing, "multiprocessing.queues.Queue"],
         pause_event: threading.Event,
-        shutdown_event: threading.Event,
+        shutdown_event: Union[threading.Event, "multiprocessing.synchronize.Event"],
     ):
         self.config = config
         self.message_queue = message_queue
         self.pause_event = pause_event
         self.shutdown_event = shutdown_event
         self.thread: Optional[threading.Thread] = None
-        self.client: Optional[speechd.SSIPClient] = None
+        self.client: Optional["speechd.SSIPClient"] = None
         self.ready_event = threading.Event()  # Set when TTS is ready to receive messages
+        # Released by Speech Dispatcher callbacks when an utterance ends
+        self._in_flight = threading.Semaphore(_MAX_IN_FLIGHT)
+        self._slot_timeout = self._estimate_slot_timeout(config)
+        self._done_events: tuple = ()
 
     def _setup_client(self):
         """Initialize and configure Speech Dispatcher client"""
+        try:
+            import speechd
+        except ImportError:
+            print("ERROR: python3-speechd is not installed")
+            print("Install with: sudo apt install python3-speechd speech-dispatcher")
+            self.shutdown_event.set()
+            return False
+
         try:
             self.client = speechd.SSIPClient("yt-liveread")
 
@@ -48,6 +73,9 @@ class TTSSpeaker:
             # Set priority to TEXT (low) so screen readers like Orca can interrupt
             self.client.set_priority(speechd.Priority.TEXT)
 
+            # Callback events that free an in-flight slot
+            self._done_events = (speechd.CallbackType.END, speechd.CallbackType.CANCEL)
+
             print(
                 f"Speech Dispatcher initialized (module: {self.config.voice_module}, priority: TEXT)"
             )
@@ -60,6 +88,63 @@ class TTSSpeaker:
             print("  systemctl --user status speech-dispatcher")
             return False
 
+    @staticmethod
+    def _estimate_slot_timeout(config: Config) -> float:
+        """Upper bound in seconds for all in-flight utterances to finish
+
+        Assumes every pending message is as long as possible; speech rate
+        -100 is treated as three times slower than rate 0.
+        """
+        max_chars = config.max_message_length + _USERNAME_ALLOWANCE
+        slowdown = 1 + 2 * max(0, -config.speech_rate) / 100
+        seconds_per_message = max_chars / _CHARS_PER_SECOND * slowdown
+        return _SLOT_TIMEOUT_MARGIN + _MAX_IN_FLIGHT * seconds_per_message
+
+    @staticmethod
+    def _on_speech_done(in_flight: threading.Semaphore, callback_type):
+        """Speech Dispatcher callback: an utterance finished or was cancelled
+
+        Bound (via functools.partial) to the semaphore the utterance's slot
+        was taken from, so a late callback after a reset can't free a slot
+        in the replacement semaphore.
+        """
+        in_flight.release()
+
+    def _acquire_slot(self) -> Optional[threading.Semaphore]:
+        """Block until fewer than _MAX_IN_FLIGHT utterances are pending
+
+        If no slot frees up within the slot timeout, the callbacks are assumed
+        lost and a fresh semaphore replaces the old one so speech can't stall
+        for good.
+
+        Returns:
+            The semaphore the slot was taken from (release it, or bind it to
+            the speech callback), or None if shutdown was requested
+        """
+        deadline = time.monotonic() + self._slot_timeout
+        in_flight = self._in_flight
+        while not in_flight.acquire(timeout=0.5):
+            if self.shutdown_event.is_set():
+                return None
+            if time.monotonic() >= deadline:
+                print("Warning: No speech callback received, resetting TTS queue")
+                # Callbacks for utterances submitted earlier stay bound to the
+                # old semaphore, so they can't raise the new one's count
+                in_flight = self._in_flight = threading.Semaphore(_MAX_IN_FLIGHT)
+                deadline = time.monotonic() + self._slot_timeout
+        return in_flight
+
+    def _wait_unpaused(self) -> bool:
+        """Block while paused, checking shutdown periodically
+
+        Returns:
+            True when playback may continue, False if shutdown was requested
+        """
+        while not self.pause_event.wait(timeout=0.5):
+            if self.shutdown_event.is_set():
+                return False
+        return not self.shutdown_event.is_set()
+
     def _run(self):
         """Main TTS speaker loop"""
         if not self._setup_client():
@@ -69,39 +154,44 @@ class TTSSpeaker:
         # Signal that TTS is ready to receive messages
         self.ready_event.set()
 
+        get = self.message_queue.get
+        is_shutdown = self.shutdown_event.is_set
+        wait_unpaused = self._wait_unpaused
+        speak = self.client.speak
+        acquire_slot = self._acquire_slot
+        on_done = self._on_speech_done
+        done_events = self._done_events
+
         try:
-            while not self.shutdown_event.is_set():
+            while not is_shutdown():
                 try:
                     # Get message from queue with timeout
                     # Timeout allows us to check shutdown_event periodically
-                    text = self.message_queue.get(timeout=0.5)
-
-                    try:
-                        # Wait if paused, checking shutdown periodically to avoid
-                        # blocking indefinitely if shutdown is triggered while paused
-                        while not self.pause_event.wait(timeout=0.5):
-                            if self.shutdown_event.is_set():
-                                break
-
-                        # Check shutdown again after potentially waiting on pause
-                        if self.shutdown_event.is_set():
-                            break
-
-                        # Print message to console
-                        print(text)
-
-                        # Speak the message
-                        if self.client:
-                            self.client.speak(text)
-
-                    finally:
-                        # Always mark task as done, even if an error occurred
-                        self.message_queue.task_done()
-
+                    text = get(timeout=0.5)
                 except queue.Empty:
                     # No messages, continue loop
                     continue
+
+                in_flight = acquire_slot()
+                if in_flight is None:
+                    break
+                # Check pause per message so pressing 'p' takes effect before
+                # the next utterance
+                if not wait_unpaused():
+                    in_flight.release()
+                    break
+
+                try:
+                    # Print message to console as it is handed to speechd
+                    print(text)
+                    speak(
+                        text,
+                        callback=functools.partial(on_done, in_flight),
+                        event_types=done_events,
+                    )
                 except Exception as e:
+                    # No callback will arrive for a failed submit
+                    in_flight.release()
                     print(f"Error speaking message: {e}")
                     # Continue despite errors with individual messages
 